@@ -7,6 +7,26 @@ __version__ = "0.1.0"
 __author__ = "Generic-Agent Team"
 
 # Export main classes and functions
-from .agent import GenericAgent, create_agent
+from .agent import (
+    GenericAgent,
+    create_agent,
+    run_agent_batch,
+    run_agent_from_json,
+    run_agent_from_file,
+)
+from .models import MCPServerConfig, AgentConfig, AgentPayload
+from .mcp_pool import MCPSessionPool
+from .batch import run_many
 
-__all__ = ["GenericAgent", "create_agent"]
+__all__ = [
+    "GenericAgent",
+    "create_agent",
+    "run_agent_batch",
+    "run_agent_from_json",
+    "run_agent_from_file",
+    "MCPServerConfig",
+    "AgentConfig",
+    "AgentPayload",
+    "MCPSessionPool",
+    "run_many",
+]
@@ -0,0 +1,110 @@
+"""
+Rate-limited concurrent execution of many agent payloads.
+
+A naive asyncio.gather over run_agent_from_json fans out in one burst,
+trips Anthropic's requests-per-minute and tokens-per-minute caps, and then
+stalls on 429s. run_many paces the fan-out with a concurrency semaphore
+and token buckets so throughput stays steady just under the limits.
+"""
+
+from typing import Any, Dict, List
+import asyncio
+import logging
+import time
+
+from anthropic import RateLimitError
+
+from .agent import GenericAgent
+from .models import AgentPayload
+
+logger = logging.getLogger(__name__)
+
+
+class _TokenBucket:
+    """
+    An asyncio token bucket refilled continuously at a per-minute rate.
+    """
+
+    def __init__(self, per_minute: float):
+        self._rate = per_minute / 60.0
+        self._capacity = float(per_minute)
+        self._tokens = float(per_minute)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0):
+        """
+        Take tokens from the bucket, sleeping until enough have refilled.
+
+        Args:
+            amount (float): Number of tokens to take; requests larger than
+                the bucket's capacity are clamped to it, since the refill
+                can never exceed capacity and the wait would otherwise
+                spin forever
+        """
+        amount = min(amount, self._capacity)
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity,
+                                   self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self._rate
+            await asyncio.sleep(wait)
+
+
+async def run_many(payloads: List[AgentPayload], rpm: float = 40,
+                   tpm: float = 16000, max_concurrency: int = 10,
+                   max_attempts: int = 3) -> List[Dict[str, Any]]:
+    """
+    Run many payloads concurrently while respecting rate limits.
+
+    At most max_concurrency agents run at once, and each run first takes
+    one request token and an estimated input-token allowance (roughly one
+    token per four characters of the task) from per-minute buckets. Runs
+    that fail on rate limiting are retried with exponential backoff, up
+    to max_attempts tries.
+
+    Args:
+        payloads (List[AgentPayload]): Payloads to run
+        rpm (float): Requests-per-minute budget
+        tpm (float): Tokens-per-minute budget
+        max_concurrency (int): Maximum agents running at once
+        max_attempts (int): Attempts per payload before giving up
+
+    Returns:
+        List[Dict[str, Any]]: One result dict per payload, in order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    request_bucket = _TokenBucket(rpm)
+    token_bucket = _TokenBucket(tpm)
+
+    def _is_rate_limited(result: Dict[str, Any]) -> bool:
+        # run() reports failures as result dicts rather than raising, so
+        # rate-limit errors surface here as failed results.
+        return (result.get('status') == 'failed'
+                and 'rate' in str(result.get('error', '')).lower())
+
+    async def _run_one(payload: AgentPayload) -> Dict[str, Any]:
+        estimated_tokens = max(1, len(payload.task) // 4)
+        async with semaphore:
+            result: Dict[str, Any] = {}
+            for attempt in range(max_attempts):
+                await request_bucket.acquire()
+                await token_bucket.acquire(estimated_tokens)
+                try:
+                    result = await GenericAgent(payload).run()
+                except RateLimitError as e:
+                    result = {'status': 'failed', 'error': str(e)}
+                if not _is_rate_limited(result):
+                    return result
+                delay = 2 ** attempt
+                logger.warning(f"Rate limited; retrying in {delay}s "
+                               f"(attempt {attempt + 1}/{max_attempts})")
+                await asyncio.sleep(delay)
+            return result
+
+    return list(await asyncio.gather(*(_run_one(p) for p in payloads)))
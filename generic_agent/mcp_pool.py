@@ -0,0 +1,151 @@
+"""
+MCP session pooling for the Generic Agent.
+
+Spawning a stdio MCP server costs a subprocess fork plus a protocol
+handshake on every agent invocation. The pool keeps sessions warm between
+runs so repeated invocations reuse live connections instead of paying that
+cost each time.
+"""
+
+from typing import Dict, Any, Tuple
+import asyncio
+import logging
+import time
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from .models import MCPServerConfig
+
+logger = logging.getLogger(__name__)
+
+
+def _pool_key(server: MCPServerConfig) -> Tuple:
+    """
+    Build a hashable identity for a server configuration.
+
+    Args:
+        server (MCPServerConfig): Server configuration
+
+    Returns:
+        Tuple: Key of (command, args, env items)
+    """
+    env = server.env or {}
+    return (server.command, tuple(server.args), frozenset(env.items()))
+
+
+class MCPSessionPool:
+    """
+    A pool of live MCP client sessions keyed by server identity.
+
+    Sessions acquired from the pool stay open after release so later
+    agent invocations with the same server configuration reuse the warm
+    connection. Idle sessions can be reaped with close_idle.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[Tuple, Dict[str, Any]] = {}
+        self._locks: Dict[Tuple, asyncio.Lock] = {}
+
+    def _lock_for(self, key: Tuple) -> asyncio.Lock:
+        if key not in self._locks:
+            self._locks[key] = asyncio.Lock()
+        return self._locks[key]
+
+    async def acquire(self, server: MCPServerConfig) -> ClientSession:
+        """
+        Return a live session for the given server, creating one if needed.
+
+        Args:
+            server (MCPServerConfig): Server configuration
+
+        Returns:
+            ClientSession: An initialized MCP client session
+        """
+        key = _pool_key(server)
+        async with self._lock_for(key):
+            entry = self._sessions.get(key)
+            if entry is None:
+                entry = await self._connect(server)
+                self._sessions[key] = entry
+                logger.info(f"Pooled new MCP session for {server.id}")
+            entry['last_used'] = time.monotonic()
+            return entry['session']
+
+    async def release(self, server: MCPServerConfig):
+        """
+        Release a session back to the pool.
+
+        The session is kept warm for reuse, so this is a no-op beyond
+        refreshing the idle timestamp.
+
+        Args:
+            server (MCPServerConfig): Server configuration the session was
+            acquired for
+        """
+        entry = self._sessions.get(_pool_key(server))
+        if entry is not None:
+            entry['last_used'] = time.monotonic()
+
+    async def close_idle(self, ttl: float):
+        """
+        Close sessions that have been idle for longer than ttl seconds.
+
+        Args:
+            ttl (float): Idle time in seconds after which a session is closed
+        """
+        now = time.monotonic()
+        for key in list(self._sessions):
+            async with self._lock_for(key):
+                entry = self._sessions.get(key)
+                if entry is not None and now - entry['last_used'] > ttl:
+                    await self._close_entry(key, entry)
+
+    async def close_all(self):
+        """
+        Close every pooled session.
+        """
+        for key in list(self._sessions):
+            async with self._lock_for(key):
+                entry = self._sessions.get(key)
+                if entry is not None:
+                    await self._close_entry(key, entry)
+
+    async def _connect(self, server: MCPServerConfig) -> Dict[str, Any]:
+        # The stdio_client/ClientSession context managers use anyio cancel
+        # scopes, which must be exited in the task that entered them, so
+        # each pooled session lives in a dedicated owner task that holds
+        # the context managers open until its stop event is set.
+        stop = asyncio.Event()
+        ready = asyncio.get_running_loop().create_future()
+
+        async def _owner():
+            try:
+                params = StdioServerParameters(
+                    command=server.command,
+                    args=server.args,
+                    env=server.env
+                )
+                async with stdio_client(params) as (read, write):
+                    async with ClientSession(read, write) as session:
+                        await session.initialize()
+                        ready.set_result(session)
+                        await stop.wait()
+            except Exception as e:
+                if not ready.done():
+                    ready.set_exception(e)
+                else:
+                    raise
+
+        task = asyncio.create_task(_owner())
+        session = await ready
+        return {'session': session, 'task': task, 'stop': stop,
+                'last_used': time.monotonic()}
+
+    async def _close_entry(self, key: Tuple, entry: Dict[str, Any]):
+        entry['stop'].set()
+        try:
+            await entry['task']
+        except Exception as e:
+            logger.warning(f"Error closing pooled MCP session: {e}")
+        del self._sessions[key]
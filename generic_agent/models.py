@@ -0,0 +1,52 @@
+"""
+Typed configuration and payload models for the Generic Agent.
+"""
+
+from typing import Dict, Any, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class MCPServerConfig(BaseModel):
+    """
+    Configuration for a single stdio MCP server.
+
+    When ``tools`` is given (a list of Anthropic-format tool definitions
+    with ``name``, ``description`` and ``input_schema``), the agent can
+    advertise the server's tools without connecting to it; the subprocess
+    is only spawned if the model actually invokes one of them.
+    """
+    id: str = 'unknown'
+    command: str
+    args: List[str] = Field(default_factory=list)
+    env: Optional[Dict[str, str]] = None
+    tools: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+class AgentConfig(BaseModel):
+    """
+    Configuration controlling how an agent run is executed.
+    """
+    workflow: str = 'default'
+    model: str = 'claude-sonnet-4-20250514'
+    max_tokens: int = 4096
+    temperature: Optional[float] = None
+    system_prompt: Optional[str] = None
+    api_key: Optional[str] = None
+    batch_mode: bool = False
+    stream: bool = False
+    lazy_schemas: bool = True
+    max_tool_iterations: int = Field(default=25)
+    mcp_servers: List[MCPServerConfig] = Field(default_factory=list)
+    execution_policy: Dict[str, Any] = Field(default_factory=dict)
+    output_schema: Dict[str, Any] = Field(default_factory=dict)
+
+
+class AgentPayload(BaseModel):
+    """
+    A complete unit of work for the agent: the task to perform, optional
+    supporting context, and the configuration to run it with.
+    """
+    task: str
+    context: Dict[str, Any] = Field(default_factory=dict)
+    config: AgentConfig = Field(default_factory=AgentConfig)
@@ -20,7 +20,9 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=[
-        "fastmcp",  # Add MCP dependency
+        "anthropic",
+        "mcp",  # Add MCP dependency
+        "pydantic>=2.0",
     ],
     extras_require={
         "dev": [